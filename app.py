@@ -1,15 +1,6 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import requests
-import os
-import datetime
-import base64
-import re
-
-from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.backends import default_backend
+
 from dotenv import load_dotenv
 from oddsy_services.stats_service import get_top_level_stats
 from ui.components.stats_bar import render_stats_bar
@@ -21,6 +12,33 @@ from oddsy_services.market_transform import build_kalshi_display_df, build_polym
 
 load_dotenv()
 
+# Copy-on-write lets the transforms drop defensive .copy() calls (always on from pandas 3.0)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+# Fetches are cached process-wide, so new sessions/tabs reuse data fetched in the last minute
+@st.cache_data(ttl=60, show_spinner=False)
+def load_kalshi_markets(status: str = "open", max_pages: int = 5, page_limit: int = 500) -> pd.DataFrame:
+    return fetch_kalshi_markets(status=status, max_pages=max_pages, page_limit=page_limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_kalshi_trades_last_week(max_pages: int = 5) -> pd.DataFrame:
+    return fetch_kalshi_trades_last_week(max_pages=max_pages)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_polymarket_markets(limit: int = 200, max_pages: int = 5):
+    return fetch_polymarket_markets(limit=limit, max_pages=max_pages)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_polymarket_trades_last_7d(limit: int = 500, max_pages: int = 50) -> pd.DataFrame:
+    return fetch_polymarket_trades_last_7d(limit=limit, max_pages=max_pages)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_polymarket_open_interest() -> pd.DataFrame:
+    return fetch_polymarket_open_interest()
+
+
 st.set_page_config(page_title="Prediction Markets MVP", layout="wide")
 st.title("Prediction Market Terminal (Kalshi - Public Endpoint MVP)")
 st.write("Data from Kalshi elections API.")
@@ -39,8 +57,8 @@ if st.button("Refresh Data"):
 
     # --- Kalshi ---
     if choice in ("Kalshi", "Both"):
-        km = fetch_kalshi_markets(status="open", max_pages=5, page_limit=500)
-        kt = fetch_kalshi_trades_last_week(max_pages=5)
+        km = load_kalshi_markets(status="open", max_pages=5, page_limit=500)
+        kt = load_kalshi_trades_last_week(max_pages=5)
 
         st.session_state["kalshi_markets_df"] = km
         st.session_state["kalshi_trades_df"] = kt
@@ -53,10 +71,10 @@ if st.button("Refresh Data"):
 
     # --- Polymarket ---
     if choice in ("Polymarket", "Both"):
-        gamma_df, books_by_token = fetch_polymarket_markets(limit=200, max_pages=5)
+        gamma_df, books_by_token = load_polymarket_markets(limit=200, max_pages=5)
         
-        pm_trades_df = fetch_polymarket_trades_last_7d(limit=500, max_pages=50)
-        pm_oi_df = fetch_polymarket_open_interest()
+        pm_trades_df = load_polymarket_trades_last_7d(limit=500, max_pages=50)
+        pm_oi_df = load_polymarket_open_interest()
         
         # st.write("DEBUG: pm_trades_df rows (raw) =", len(pm_trades_df))
         # if not pm_trades_df.empty and "timestamp" in pm_trades_df.columns:
@@ -75,6 +93,9 @@ if st.button("Refresh Data"):
         st.session_state["pm_trades_df"] = None
         st.session_state["pm_oi_df"] = None
 
+    # new data → stats get recomputed below
+    st.session_state.pop("top_level_stats", None)
+
     # unified df for UI rendering
     st.session_state["df_display"] = pd.concat(df_list, ignore_index=True) if df_list else pd.DataFrame()
 
@@ -96,38 +117,44 @@ else:
     # ---- Top-level stats bar (already working) ----
     choice = st.session_state.get("platform_choice", "Kalshi")
 
-    df_display = st.session_state.get("df_display")
-    kalshi_markets_df = st.session_state.get("kalshi_markets_df")
-    kalshi_trades_df = st.session_state.get("kalshi_trades_df")
-    pm_gamma_df = st.session_state.get("pm_gamma_df")
-    pm_trades_df = st.session_state.get("pm_trades_df")
-    pm_oi_df = st.session_state.get("pm_oi_df")
-
-    # For Polymarket-only selection, pass empty Kalshi so TopLevelStats.kalshi still exists
-    if choice == "Polymarket":
-        empty_k = pd.DataFrame()
-        top_level_stats = get_top_level_stats(
-            kalshi_markets_df=empty_k,
-            kalshi_trades_df=None,
-            polymarket_gamma_df=pm_gamma_df,
-            polymarket_display_df=df_display,
-            polymarket_trades_df=pm_trades_df,
-            polymarket_oi_df=pm_oi_df,
-        )
-    elif choice == "Kalshi":
-        top_level_stats = get_top_level_stats(
-            kalshi_markets_df=kalshi_markets_df,
-            kalshi_trades_df=kalshi_trades_df,
-        )
-    else:  # Both (we can keep it simple for now)
-        top_level_stats = get_top_level_stats(
-            kalshi_markets_df=kalshi_markets_df,
-            kalshi_trades_df=kalshi_trades_df,
-            polymarket_gamma_df=pm_gamma_df,
-            polymarket_display_df=df_display,
-            polymarket_trades_df=pm_trades_df,
-            polymarket_oi_df=pm_oi_df,
-        )
+    # Stats only change with the data or the platform choice; reuse them on other reruns
+    cached_stats = st.session_state.get("top_level_stats")
+    if cached_stats is not None and cached_stats[0] == choice:
+        top_level_stats = cached_stats[1]
+    else:
+        df_display = st.session_state.get("df_display")
+        kalshi_markets_df = st.session_state.get("kalshi_markets_df")
+        kalshi_trades_df = st.session_state.get("kalshi_trades_df")
+        pm_gamma_df = st.session_state.get("pm_gamma_df")
+        pm_trades_df = st.session_state.get("pm_trades_df")
+        pm_oi_df = st.session_state.get("pm_oi_df")
+
+        # For Polymarket-only selection, pass empty Kalshi so TopLevelStats.kalshi still exists
+        if choice == "Polymarket":
+            empty_k = pd.DataFrame()
+            top_level_stats = get_top_level_stats(
+                kalshi_markets_df=empty_k,
+                kalshi_trades_df=None,
+                polymarket_gamma_df=pm_gamma_df,
+                polymarket_display_df=df_display,
+                polymarket_trades_df=pm_trades_df,
+                polymarket_oi_df=pm_oi_df,
+            )
+        elif choice == "Kalshi":
+            top_level_stats = get_top_level_stats(
+                kalshi_markets_df=kalshi_markets_df,
+                kalshi_trades_df=kalshi_trades_df,
+            )
+        else:  # Both (we can keep it simple for now)
+            top_level_stats = get_top_level_stats(
+                kalshi_markets_df=kalshi_markets_df,
+                kalshi_trades_df=kalshi_trades_df,
+                polymarket_gamma_df=pm_gamma_df,
+                polymarket_display_df=df_display,
+                polymarket_trades_df=pm_trades_df,
+                polymarket_oi_df=pm_oi_df,
+            )
+        st.session_state["top_level_stats"] = (choice, top_level_stats)
 
     render_stats_bar(top_level_stats, mode=choice)
     
@@ -1,15 +1,19 @@
 import os
 import datetime
-import base64
 import pandas as pd
 import requests
 
+from urllib.parse import urlencode
+from binascii import b2a_base64
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.backends import default_backend
 
 BASE_URL = "https://api.elections.kalshi.com"
 
+# shared session so paginated calls reuse the pooled HTTPS connection
+_session = requests.Session()
+
 def load_private_key_from_path(key_path: str):
     if not key_path:
         raise RuntimeError("KALSHI_API_PRIVATE_KEY (path) is not set in .env")
@@ -41,7 +45,7 @@ def create_signature(private_key, timestamp: str, method: str, path: str) -> str
         ),
         hashes.SHA256(),
     )
-    return base64.b64encode(signature).decode("utf-8")
+    return b2a_base64(signature, newline=False).decode("ascii")
 
 def kalshi_get(path: str) -> dict:
     api_key_id = os.getenv("KALSHI_API_KEY_ID")
@@ -67,7 +71,7 @@ def kalshi_get(path: str) -> dict:
     }
 
     url = BASE_URL + path
-    r = requests.get(url, headers=headers, timeout=30)
+    r = _session.get(url, headers=headers, timeout=30)
     r.raise_for_status()
     return r.json()
 
@@ -81,13 +85,13 @@ def fetch_kalshi_markets(status: str = "open", max_pages: int = 5, page_limit: i
         if pages_fetched > max_pages:
             break
 
-        query = f"?limit={page_limit}"
+        params = {"limit": page_limit}
         if status:
-            query += f"&status={status}"
+            params["status"] = status
         if cursor:
-            query += f"&cursor={cursor}"
+            params["cursor"] = cursor
 
-        path = f"/trade-api/v2/markets{query}"
+        path = f"/trade-api/v2/markets?{urlencode(params)}"
         data = kalshi_get(path)
 
         markets = data.get("markets", data)
@@ -120,11 +124,11 @@ def fetch_kalshi_trades_last_week(max_pages: int = 5) -> pd.DataFrame:
         if pages_fetched > max_pages:
             break
 
-        query = f"?limit={limit}&min_ts={week_ago}&max_ts={now}"
+        params = {"limit": limit, "min_ts": week_ago, "max_ts": now}
         if cursor:
-            query += f"&cursor={cursor}"
+            params["cursor"] = cursor
 
-        path = f"/trade-api/v2/markets/trades{query}"
+        path = f"/trade-api/v2/markets/trades?{urlencode(params)}"
         data = kalshi_get(path)
 
         trades = data.get("trades", [])
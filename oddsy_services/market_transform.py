@@ -1,18 +1,25 @@
 import re
+import json
 import numpy as np
 import pandas as pd
 
-SHORT_CODE_RE = re.compile(r"^[A-Z]{2,6}$")
 SI_SWIM_PATTERN = re.compile(
     r"^Will (.+?) be on the cover of .*Sports Illustrated Swimsuit",
     re.IGNORECASE,
 )
 
+def _is_short_code(s: str) -> bool:
+    """
+    2-6 uppercase ASCII letters (e.g. a ticker-style code like "JD").
+    Plain str checks, no regex engine call.
+    """
+    return 2 <= len(s) <= 6 and s.isascii() and s.isalpha() and s.isupper()
+
 def extract_option_name_from_title(row: dict):
     title = (row.get("title") or "").strip()
     yes_sub = (row.get("yes_sub_title") or "").strip()
 
-    if not (yes_sub and SHORT_CODE_RE.fullmatch(yes_sub)):
+    if not _is_short_code(yes_sub):
         return None
 
     m = SI_SWIM_PATTERN.match(title)
@@ -22,6 +29,10 @@ def extract_option_name_from_title(row: dict):
     return None
 
 def compute_probability(row: dict):
+    """
+    Row-wise reference for implied_prob_pct; build_kalshi_display_df uses the
+    equivalent np.select over whole columns.
+    """
     lt = row.get("last_traded_pct")
     if lt is not None and not np.isnan(lt) and lt > 0:
         return lt
@@ -70,41 +81,86 @@ def compute_implied_yes_prob_from_dollars(row: dict):
 
     return None
 
-def build_kalshi_display_df(df_display: pd.DataFrame) -> pd.DataFrame:
-    df = df_display.copy()
+def _num_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype=np.float64)
+    return pd.to_numeric(df[col], errors="coerce")
 
+def _str_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df[col].fillna("").astype(str).str.strip()
+
+def _to_pct(values) -> np.ndarray:
+    """
+    0..1 prices -> percent rounded to 0.1, as one float64 pass over the whole matrix.
+    """
+    pct = np.asarray(values, dtype=np.float64) * 100.0
+    np.round(pct, 1, out=pct)
+    return pct
+
+def build_kalshi_display_df(df_display: pd.DataFrame) -> pd.DataFrame:
     cols = [
         "title","subtitle","ticker","event_ticker","category","market_type","status","close_time",
         "yes_bid_dollars","yes_ask_dollars","no_bid_dollars","no_ask_dollars",
         "last_price_dollars","volume","volume_24h","open_interest","yes_sub_title",
     ]
-    existing_cols = [c for c in cols if c in df.columns]
-    df = df[existing_cols]
-
-    df["option_name_from_title"] = df.apply(lambda r: extract_option_name_from_title(r.to_dict()), axis=1)
-    df["implied_yes_prob"] = df.apply(lambda r: compute_implied_yes_prob_from_dollars(r.to_dict()), axis=1)
+    # column projection already yields a new frame; with copy-on-write no extra .copy() is needed
+    existing_cols = [c for c in cols if c in df_display.columns]
+    df = df_display[existing_cols]
+
+    # Column-wise versions of extract_option_name_from_title / compute_implied_yes_prob_from_dollars.
+    # The title regex can only hit where the short-code gate passes, so only run it there.
+    is_short_code = _str_column(df, "yes_sub_title").map(_is_short_code).astype(bool)
+    option_names = pd.Series(None, index=df.index, dtype=object)
+    if is_short_code.any():
+        titles = _str_column(df.loc[is_short_code], "title")
+        option_names.loc[is_short_code] = titles.str.extract(SI_SWIM_PATTERN, expand=False).str.strip()
+    df["option_name_from_title"] = option_names
+
+    mtype = _str_column(df, "market_type").str.lower()
+    last = _num_column(df, "last_price_dollars")
+    bid_ask_mid = pd.concat([_num_column(df, "yes_bid_dollars"), _num_column(df, "yes_ask_dollars")], axis=1).mean(axis=1)
+    implied_yes_prob = (last.fillna(bid_ask_mid) * 100.0).round(1)
+    df["implied_yes_prob"] = implied_yes_prob.where((mtype == "") | (mtype == "binary"))
     df["platform"] = "Kalshi"
 
-    df_display = df.copy()
-    for col in ["yes_bid_dollars","yes_ask_dollars","no_bid_dollars","no_ask_dollars","last_price_dollars"]:
-        if col in df_display.columns:
-            df_display[col] = (df_display[col].astype(float) * 100).round(1)
+    # low-cardinality labels: dictionary-encoded, smaller and cheaper to compare/group
+    for col in ("category", "market_type", "status"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    price_cols = [
+        c for c in ["yes_bid_dollars","yes_ask_dollars","no_bid_dollars","no_ask_dollars","last_price_dollars"]
+        if c in df.columns
+    ]
+    if price_cols:
+        df[price_cols] = _to_pct(df[price_cols].to_numpy(dtype=np.float64, na_value=np.nan))
 
-    df_display = df_display.rename(columns={
+    # rename on the projected frame itself; a plain rename() is another full copy without CoW
+    df.rename(columns={
         "yes_bid_dollars":"yes_bid_pct",
         "yes_ask_dollars":"yes_ask_pct",
         "no_bid_dollars":"no_bid_pct",
         "no_ask_dollars":"no_ask_pct",
         "last_price_dollars":"last_traded_pct",
-    })
-
-    df_display["implied_prob_pct"] = df_display.apply(lambda r: compute_probability(r.to_dict()), axis=1)
+    }, inplace=True)
+
+    # compute_probability as one np.select pass (NaN compares False, so missing sides drop out)
+    lt = _num_column(df, "last_traded_pct").to_numpy()
+    bid = _num_column(df, "yes_bid_pct").to_numpy()
+    ask = _num_column(df, "yes_ask_pct").to_numpy()
+    df["implied_prob_pct"] = np.select(
+        [lt > 0, ~np.isnan(bid + ask) & ((bid > 0) | (ask > 0)), bid > 0, ask > 0],
+        [lt, np.round((bid + ask) / 2.0, 1), bid, ask],
+        default=np.nan,
+    )
 
     # ensure event_ticker exists
-    if "event_ticker" not in df_display.columns:
-        df_display["event_ticker"] = df_display.get("ticker")
+    if "event_ticker" not in df.columns:
+        df["event_ticker"] = df.get("ticker")
 
-    return df_display
+    return df
 
 def _best_prices_from_book(book: dict):
     """
@@ -126,6 +182,36 @@ def _best_prices_from_book(book: dict):
 
     return best_bid, best_ask
 
+def _parse_listish(x):
+    """
+    Gamma often returns outcomes/outcomePrices/clobTokenIds as JSON-array strings.
+    Anything we can't read as a list becomes [].
+    """
+    if isinstance(x, list):
+        return x
+    if isinstance(x, str) and x.strip().startswith("["):
+        try:
+            return json.loads(x)
+        except Exception:
+            return []
+    return []
+
+def _list_column(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series([[]] * len(df), index=df.index, dtype=object)
+    return df[col].map(_parse_listish)
+
+def _coalesce(df: pd.DataFrame, cols: list, default=None) -> pd.Series:
+    """
+    Column-wise `a or b or c`: first non-empty value across cols, else default.
+    """
+    out = pd.Series(default, index=df.index, dtype=object)
+    for col in reversed(cols):
+        if col in df.columns:
+            v = df[col]
+            out = v.where(v.notna() & (v != ""), out)
+    return out
+
 def build_polymarket_display_df(gamma_df: pd.DataFrame, books_by_token: dict) -> pd.DataFrame:
     """
     Explode Gamma market rows into outcome rows so the UI grouping works like Kalshi:
@@ -134,114 +220,90 @@ def build_polymarket_display_df(gamma_df: pd.DataFrame, books_by_token: dict) ->
     if gamma_df is None or gamma_df.empty:
         return pd.DataFrame()
 
-    rows = []
-
-    for _, m in gamma_df.iterrows():
-        question = m.get("question") or m.get("title") or m.get("slug") or "Polymarket market"
-        category = m.get("category")
-        close_time = m.get("endDateIso") or m.get("endDate") or m.get("closedTime")
-        condition_id = m.get("conditionId")  # stable-ish unique id :contentReference[oaicite:9]{index=9}
-        slug = m.get("slug")
-
-        # Prefer volume24hrClob if present, else volume24hr
-        vol_24h = m.get("volume24hrClob")
-        if vol_24h is None:
-            vol_24h = m.get("volume24hr")
-
-        # outcomes & prices
-        outcomes = m.get("outcomes")
-        outcome_prices = m.get("outcomePrices")
-        clob_token_ids = m.get("clobTokenIds")
-
-        # These are often strings that look like JSON arrays in Gamma
-        import json
-        def parse_listish(x):
-            if x is None:
-                return []
-            if isinstance(x, list):
-                return x
-            if isinstance(x, str) and x.strip().startswith("["):
-                try:
-                    return json.loads(x)
-                except Exception:
-                    return []
-            return []
+    outcomes = _list_column(gamma_df, "outcomes")
+    outcome_prices = _list_column(gamma_df, "outcomePrices")
+    token_ids = _list_column(gamma_df, "clobTokenIds")
+    n_outcomes = outcomes.map(len)
+
+    # explode() needs equal-length lists per row:
+    # prices fall back to None when mismatched, token ids are padded/truncated
+    outcome_prices = [
+        p if len(p) == n else [None] * n for p, n in zip(outcome_prices, n_outcomes)
+    ]
+    token_ids = [(list(t) + [None] * n)[:n] for t, n in zip(token_ids, n_outcomes)]
+
+    question = _coalesce(gamma_df, ["question", "title", "slug"], "Polymarket market")
+
+    # Prefer volume24hrClob if present, else volume24hr
+    vol_24h = pd.to_numeric(_coalesce(gamma_df, ["volume24hrClob", "volume24hr"], 0), errors="coerce")
+
+    closed = gamma_df["closed"] if "closed" in gamma_df.columns else pd.Series(False, index=gamma_df.index)
+    is_closed = closed.notna() & closed.astype(bool)
+
+    markets = pd.DataFrame({
+        # event grouping key for Polymarket (we'll refine later for cross-platform matching)
+        "event_ticker": _coalesce(gamma_df, ["slug", "conditionId"]).fillna(question).map(str),
+        "title": question,
+        "condition_id": gamma_df["conditionId"] if "conditionId" in gamma_df.columns else None,
+        "category": gamma_df["category"] if "category" in gamma_df.columns else None,
+        "market_type": np.where(n_outcomes > 2, "categorical", "binary"),
+        "status": np.where(is_closed, "closed", "open"),
+        "close_time": _coalesce(gamma_df, ["endDateIso", "endDate", "closedTime"]),
+        "volume_24h": vol_24h,
+        "outcome": outcomes,
+        "outcome_price": outcome_prices,
+        "token_id": token_ids,
+    }, index=gamma_df.index)
+    markets = markets[n_outcomes > 0]
+    if markets.empty:
+        return pd.DataFrame()
+
+    # One row per outcome
+    df = markets.explode(["outcome", "outcome_price", "token_id"], ignore_index=True)
+
+    token_id = df["token_id"].map(str, na_action="ignore")
+    fallback_ticker = df["condition_id"].map(str) + ":" + df["outcome"].map(str)
+
+    # best bid/ask per token, looked up once per book instead of once per row
+    best_bid_by_token = {}
+    best_ask_by_token = {}
+    for tid, book in books_by_token.items():
+        best_bid_by_token[tid], best_ask_by_token[tid] = _best_prices_from_book(book)
+
+    yes_bid = pd.to_numeric(token_id.map(best_bid_by_token), errors="coerce")
+    yes_ask = pd.to_numeric(token_id.map(best_ask_by_token), errors="coerce")
 
-        outcomes = parse_listish(outcomes)
-        outcome_prices = parse_listish(outcome_prices)
-        token_ids = parse_listish(clob_token_ids)
-
-        # fallback if prices missing or mismatched
-        if len(outcome_prices) != len(outcomes):
-            outcome_prices = [None] * len(outcomes)
-
-        # Map each outcome -> a row that looks like your Kalshi df_display row
-        for i, outcome in enumerate(outcomes):
-            token_id = str(token_ids[i]) if i < len(token_ids) else None
-
-            yes_bid = None
-            yes_ask = None
-            last_traded = None
-
-            if token_id and token_id in books_by_token:
-                b = books_by_token[token_id]
-                best_bid, best_ask = _best_prices_from_book(b)
-                yes_bid = best_bid
-                yes_ask = best_ask
-
-            # If we didn’t get bid/ask, use Gamma’s outcomePrices as a midpoint-ish estimate
-            mid = None
-            try:
-                if yes_bid is not None and yes_ask is not None:
-                    mid = (yes_bid + yes_ask) / 2.0
-                elif yes_bid is not None:
-                    mid = yes_bid
-                elif yes_ask is not None:
-                    mid = yes_ask
-            except Exception:
-                mid = None
-
-            if mid is None:
-                try:
-                    op = outcome_prices[i]
-                    if op is not None:
-                        mid = float(op)
-                except Exception:
-                    mid = None
-
-            implied_yes_prob = None
-            if mid is not None and not np.isnan(mid):
-                implied_yes_prob = round(mid * 100.0, 1)
-
-            rows.append({
-                # event grouping key for Polymarket (we'll refine later for cross-platform matching)
-                "event_ticker": str(slug or condition_id or question),
-
-                "title": question,
-                "subtitle": None,
-                "ticker": str(token_id or f"{condition_id}:{outcome}"),
-
-                "category": category,
-                "market_type": "categorical" if len(outcomes) > 2 else "binary",
-                "status": "open" if not m.get("closed") else "closed",
-                "close_time": close_time,
-
-                # percent fields your UI expects
-                "yes_bid_pct": None if yes_bid is None else round(yes_bid * 100.0, 1),
-                "yes_ask_pct": None if yes_ask is None else round(yes_ask * 100.0, 1),
-                "last_traded_pct": None if last_traded is None else round(last_traded * 100.0, 1),
-
-                # the one your UI uses
-                "implied_yes_prob": implied_yes_prob,
-
-                # used for sorting events
-                "volume_24h": vol_24h if vol_24h is not None else 0,
-
-                # for labels (your outcome_label uses yes_sub_title)
-                "yes_sub_title": str(outcome),
-
-                "platform": "Polymarket",
-            })
-
-    df = pd.DataFrame(rows)
-    return df
\ No newline at end of file
+    # bid/ask midpoint (or whichever side exists); else Gamma's outcomePrices estimate
+    mid = pd.concat([yes_bid, yes_ask], axis=1).mean(axis=1)
+    mid = mid.fillna(pd.to_numeric(df["outcome_price"], errors="coerce"))
+
+    yes_bid_pct, yes_ask_pct, implied_yes_prob = _to_pct(np.column_stack([yes_bid, yes_ask, mid])).T
+
+    return pd.DataFrame({
+        "event_ticker": df["event_ticker"],
+
+        "title": df["title"],
+        "subtitle": None,
+        "ticker": token_id.where(token_id.notna() & (token_id != ""), fallback_ticker),
+
+        "category": df["category"],
+        "market_type": df["market_type"],
+        "status": df["status"],
+        "close_time": df["close_time"],
+
+        # percent fields your UI expects
+        "yes_bid_pct": yes_bid_pct,
+        "yes_ask_pct": yes_ask_pct,
+        "last_traded_pct": None,
+
+        # the one your UI uses
+        "implied_yes_prob": implied_yes_prob,
+
+        # used for sorting events
+        "volume_24h": df["volume_24h"],
+
+        # for labels (your outcome_label uses yes_sub_title)
+        "yes_sub_title": df["outcome"].map(str),
+
+        "platform": "Polymarket",
+    })
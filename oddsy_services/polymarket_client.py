@@ -1,23 +1,46 @@
 import os
 import json
-import time
 import datetime
+import orjson
 import requests
+import numpy as np
 import pandas as pd
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 GAMMA_BASE_URL = os.getenv("POLYMARKET_GAMMA_URL", "https://gamma-api.polymarket.com")
 CLOB_BASE_URL  = os.getenv("POLYMARKET_CLOB_URL",  "https://clob.polymarket.com")
 DATA_API_BASE_URL = os.getenv("POLYMARKET_DATA_API_URL", "https://data-api.polymarket.com")
 
+# shared keep-alive session; pool sized for the concurrent /books fan-out,
+# retries only cover connection-level failures
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(3, backoff_factor=0.2)),
+)
+
 def _get(url: str, params: dict | None = None):
-    r = requests.get(url, params=params, timeout=30)
+    r = _session.get(url, params=params, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 def _post(url: str, payload):
-    r = requests.post(url, json=payload, timeout=30)
+    r = _session.post(url, json=payload, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
+
+# Gamma fields read downstream (display transform + stats); everything else is dropped at load
+GAMMA_COLS = (
+    "id", "question", "title", "slug", "conditionId", "category",
+    "endDateIso", "endDate", "closedTime", "active", "closed",
+    "outcomes", "outcomePrices", "clobTokenIds",
+    "volume24hrClob", "volume24hr",
+)
+GAMMA_NUMERIC_COLS = ("volume24hrClob", "volume24hr")
 
 def fetch_gamma_markets(
     limit: int = 200,
@@ -27,26 +50,33 @@ def fetch_gamma_markets(
 ) -> pd.DataFrame:
     """
     Gamma GET /markets supports pagination via limit + offset. :contentReference[oaicite:3]{index=3}
+    Page 0 is fetched first; if it comes back full, the remaining pages are fetched concurrently.
     """
-    all_rows = []
-    offset = 0
-
-    for _ in range(max_pages):
+    def fetch_page(page: int):
         params = {
             "limit": limit,
-            "offset": offset,
+            "offset": page * limit,
             "closed": closed,
             "active": active,
         }
-        rows = _get(f"{GAMMA_BASE_URL}/markets", params=params)
-        if not rows:
-            break
+        return _get(f"{GAMMA_BASE_URL}/markets", params=params)
 
-        all_rows.extend(rows)
-        offset += limit
-        time.sleep(0.05)  # tiny politeness pause
+    all_rows = list(fetch_page(0) or [])
 
-    return pd.DataFrame(all_rows)
+    # a short first page means there is nothing further to fetch
+    if len(all_rows) == limit and max_pages > 1:
+        with ThreadPoolExecutor(max_workers=max_pages - 1) as ex:
+            # map() keeps page order; stop at the first empty page like the sequential loop did
+            for rows in ex.map(fetch_page, range(1, max_pages)):
+                if not rows:
+                    break
+                all_rows.extend(rows)
+
+    # fixed column set: no per-row key discovery, and unused Gamma fields never become columns
+    df = pd.DataFrame.from_records(all_rows, columns=GAMMA_COLS)
+    for col in GAMMA_NUMERIC_COLS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
 
 def _parse_listish(x):
     """
@@ -70,42 +100,44 @@ def _parse_listish(x):
             return [p.strip() for p in s.split(",") if p.strip()]
     return None
 
-def fetch_clob_books(token_ids: list[str], chunk_size: int = 75) -> dict:
+def _fetch_books_chunk(chunk: list[str]):
+    # IMPORTANT: body is a LIST, not {"params": ...}
+    payload = [{"token_id": str(t)} for t in chunk]
+
+    try:
+        return _post(f"{CLOB_BASE_URL}/books", payload)
+    except requests.HTTPError as e:
+        # surface the response body so we can see exactly what it disliked
+        body = ""
+        try:
+            body = e.response.text
+        except Exception:
+            pass
+        raise RuntimeError(f"/books 400. Body: {body}") from e
+
+def fetch_clob_books(token_ids: list[str], chunk_size: int = 75, max_workers: int = 8) -> dict:
     """
     POST /books expects a JSON array body:
     [
       {"token_id": "123"},
       {"token_id": "456"}
     ]
-    :contentReference[oaicite:2]{index=2}
+    Chunks are independent, so they're posted concurrently (at most max_workers in flight).
     """
-    out = {}
-    for i in range(0, len(token_ids), chunk_size):
-        chunk = token_ids[i : i + chunk_size]
-
-        # IMPORTANT: body is a LIST, not {"params": ...}
-        payload = [{"token_id": str(t)} for t in chunk]
-
-        try:
-            books = _post(f"{CLOB_BASE_URL}/books", payload)
-        except requests.HTTPError as e:
-            # surface the response body so we can see exactly what it disliked
-            body = ""
-            try:
-                body = e.response.text
-            except Exception:
-                pass
-            raise RuntimeError(f"/books 400. Body: {body}") from e
-
-        # Response is usually a list of book summaries; map by token id
-        if isinstance(books, list):
-            for b in books:
-                tid = str(b.get("token_id") or b.get("asset_id") or "")
-                if tid:
-                    out[tid] = b
-        elif isinstance(books, dict):
-            out.update(books)
+    chunks = [token_ids[i : i + chunk_size] for i in range(0, len(token_ids), chunk_size)]
 
+    out = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        # map() yields results in chunk order, so merging stays deterministic
+        for books in ex.map(_fetch_books_chunk, chunks):
+            # Response is usually a list of book summaries; map by token id
+            if isinstance(books, list):
+                out.update({str(b.get("token_id") or b.get("asset_id") or ""): b for b in books})
+            elif isinstance(books, dict):
+                out.update(books)
+
+    # books without an id land under "" above; drop them once
+    out.pop("", None)
     return out
 
 def fetch_polymarket_markets(limit: int = 200, max_pages: int = 5):
@@ -122,12 +154,9 @@ def fetch_polymarket_markets(limit: int = 200, max_pages: int = 5):
     # collect token ids from Gamma
     token_ids = []
     if "clobTokenIds" in gamma_df.columns:
-        for v in gamma_df["clobTokenIds"].tolist():
-            ids = _parse_listish(v) or []
-            for tid in ids:
-                token_ids.append(str(tid))
+        parsed = map(_parse_listish, gamma_df["clobTokenIds"].to_numpy())
+        token_ids = sorted({str(tid) for ids in parsed if ids for tid in ids})
 
-    token_ids = sorted(set(token_ids))
     books_by_token = fetch_clob_books(token_ids) if token_ids else {}
 
     return gamma_df, books_by_token
@@ -163,32 +192,30 @@ def fetch_polymarket_trades_last_7d(limit=500, max_pages=50):
     for page in range(max_pages):
         params = {"limit": limit, "offset": offset}
         url = "https://data-api.polymarket.com/trades"
-        r = requests.get(url, params=params, timeout=30)
+        r = _session.get(url, params=params, timeout=30)
         r.raise_for_status()
 
-        batch = r.json()
+        batch = orjson.loads(r.content)
         if not isinstance(batch, list) or len(batch) == 0:
             break
 
-        # Convert to DF for filtering
-        dfb = pd.DataFrame(batch)
-        if "timestamp" not in dfb.columns:
+        if any("timestamp" not in t for t in batch):
             # Unexpected schema — bail safely
             break
 
-        # Keep only last 7 days
-        df_keep = dfb[dfb["timestamp"].astype(int) >= cutoff]
-        all_rows.append(df_keep)
+        # Parse timestamps once per page; both the filter and the stop check use it
+        ts = np.fromiter((int(t["timestamp"]) for t in batch), dtype=np.int64, count=len(batch))
+
+        # Keep only last 7 days (raw rows; the DataFrame is built once after paging)
+        all_rows.extend(compress(batch, ts >= cutoff))
 
         # Stop when the batch is already older than cutoff (since sorted desc)
-        oldest_ts = int(dfb["timestamp"].min())
-        if oldest_ts < cutoff:
+        if ts.min() < cutoff:
             break
 
         offset += limit  # IMPORTANT: step by page size, not 1000 blindly
 
-    out = pd.concat(all_rows, ignore_index=True) if all_rows else pd.DataFrame()
-    return out
+    return pd.DataFrame(all_rows)
 
 def fetch_polymarket_open_interest():
     """
@@ -196,7 +223,7 @@ def fetch_polymarket_open_interest():
     If the API returns a GLOBAL row, we’ll use that later; otherwise sum markets.
     """
     url = "https://data-api.polymarket.com/oi"
-    r = requests.get(url, timeout=30)
+    r = _session.get(url, timeout=30)
     r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content)
     return pd.DataFrame(data) if isinstance(data, list) else pd.DataFrame()
\ No newline at end of file
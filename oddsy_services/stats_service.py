@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 
@@ -50,12 +51,14 @@ def compute_kalshi_stats(
             open_interest=0.0,
         )
 
+    market_cols = frozenset(markets_df.columns)
+
     # ----- Active markets -----
     active_markets = len(markets_df)
 
     # ----- Open interest -----
-    if "open_interest" in markets_df.columns:
-        open_interest = float(markets_df["open_interest"].fillna(0).sum())
+    if "open_interest" in market_cols:
+        open_interest = float(markets_df["open_interest"].to_numpy(dtype=np.float64, na_value=0.0).sum())
     else:
         open_interest = 0.0
 
@@ -67,28 +70,32 @@ def compute_kalshi_stats(
     #  CASE 1: REAL weekly stats using trades_df (THE GOOD CASE)
     # ================================================================
     if trades_df is not None and not trades_df.empty:
+        trade_cols = frozenset(trades_df.columns)
+        size = (
+            trades_df["count"].to_numpy(dtype=np.float64, na_value=0.0)
+            if "count" in trade_cols
+            else None
+        )
 
         # Weekly transactions = total contract count
-        if "count" in trades_df.columns:
-            weekly_transactions = int(trades_df["count"].fillna(0).sum())
+        if size is not None:
+            weekly_transactions = int(size.sum())
         else:
             # Fallback: treat each row as one trade
             weekly_transactions = len(trades_df)
 
         # Weekly notional = SUM(price * count)
         # price is in cents → convert to dollars
-        if "price" in trades_df.columns and "count" in trades_df.columns:
-            price_cents = trades_df["price"].fillna(0).astype(float)
-            size = trades_df["count"].fillna(0).astype(float)
-            weekly_notional = float((price_cents / 100.0 * size).sum())
+        if "price" in trade_cols and size is not None:
+            price_cents = trades_df["price"].to_numpy(dtype=np.float64, na_value=0.0)
+            weekly_notional = float(np.dot(price_cents, size) / 100.0)
 
         else:
             # Fallback estimate: use any *_price_dollars column
             price_cols = [c for c in trades_df.columns if c.endswith("_price_dollars")]
-            if price_cols and "count" in trades_df.columns:
-                price_dollars = trades_df[price_cols[0]].fillna(0).astype(float)
-                size = trades_df["count"].fillna(0).astype(float)
-                weekly_notional = float((price_dollars * size).sum())
+            if price_cols and size is not None:
+                price_dollars = trades_df[price_cols[0]].to_numpy(dtype=np.float64, na_value=0.0)
+                weekly_notional = float(np.dot(price_dollars, size))
 
         return ExchangeStats(
             name="Kalshi",
@@ -101,23 +108,27 @@ def compute_kalshi_stats(
     # ================================================================
     #  CASE 2: No trades_df → fallback approximation using markets_df
     # ================================================================
-    if "volume_24h" in markets_df.columns:
-        v24 = markets_df["volume_24h"].fillna(0).astype(float)
+    price = (
+        markets_df["last_price_dollars"].to_numpy(dtype=np.float64, na_value=0.0)
+        if "last_price_dollars" in market_cols
+        else None
+    )
+
+    if "volume_24h" in market_cols:
+        v24 = markets_df["volume_24h"].to_numpy(dtype=np.float64, na_value=0.0)
         weekly_transactions = int(v24.sum() * 7)
 
-        if "last_price_dollars" in markets_df.columns:
-            price = markets_df["last_price_dollars"].fillna(0).astype(float)
-            weekly_notional = float((v24 * price * 7).sum())
+        if price is not None:
+            weekly_notional = float(np.dot(v24, price) * 7)
         else:
             weekly_notional = float(v24.sum() * 7)
 
-    elif "volume" in markets_df.columns:
-        vol = markets_df["volume"].fillna(0).astype(float)
+    elif "volume" in market_cols:
+        vol = markets_df["volume"].to_numpy(dtype=np.float64, na_value=0.0)
         weekly_transactions = int(vol.sum())
 
-        if "last_price_dollars" in markets_df.columns:
-            price = markets_df["last_price_dollars"].fillna(0).astype(float)
-            weekly_notional = float((vol * price).sum())
+        if price is not None:
+            weekly_notional = float(np.dot(vol, price))
         else:
             weekly_notional = float(vol.sum())
 
@@ -153,11 +164,13 @@ def compute_polymarket_stats(
             open_interest=0.0,
         )
 
+    display_cols = frozenset(display_df.columns) if display_df is not None else frozenset()
+
     # ----- Active markets -----
     if gamma_df is not None and not gamma_df.empty:
         active_markets = len(gamma_df)
     else:
-        if display_df is not None and "event_ticker" in display_df.columns:
+        if "event_ticker" in display_cols:
             active_markets = int(display_df["event_ticker"].nunique())
         else:
             active_markets = 0 if display_df is None else len(display_df)
@@ -166,12 +179,13 @@ def compute_polymarket_stats(
     open_interest = 0.0
     if oi_df is not None and not oi_df.empty:
         # If API provides a GLOBAL row, prefer that
-        if "market" in oi_df.columns and "value" in oi_df.columns:
+        oi_cols = frozenset(oi_df.columns)
+        if "market" in oi_cols and "value" in oi_cols:
             global_row = oi_df[oi_df["market"] == "GLOBAL"]
             if not global_row.empty:
-                open_interest = float(global_row["value"].fillna(0).iloc[0])
+                open_interest = float(global_row["value"].to_numpy(dtype=np.float64, na_value=0.0)[0])
             else:
-                open_interest = float(oi_df["value"].fillna(0).astype(float).sum())
+                open_interest = float(oi_df["value"].to_numpy(dtype=np.float64, na_value=0.0).sum())
 
     # ----- Real weekly stats from trades_df (preferred) -----
     weekly_transactions = 0
@@ -180,10 +194,11 @@ def compute_polymarket_stats(
     if trades_df is not None and not trades_df.empty:
         weekly_transactions = int(len(trades_df))
 
-        if "price" in trades_df.columns and "size" in trades_df.columns:
-            p = trades_df["price"].fillna(0).astype(float)
-            s = trades_df["size"].fillna(0).astype(float)
-            weekly_notional = float((p * s).sum())
+        trade_cols = frozenset(trades_df.columns)
+        if "price" in trade_cols and "size" in trade_cols:
+            p = trades_df["price"].to_numpy(dtype=np.float64, na_value=0.0)
+            s = trades_df["size"].to_numpy(dtype=np.float64, na_value=0.0)
+            weekly_notional = float(np.dot(p, s))
         else:
             weekly_notional = 0.0
             
@@ -198,18 +213,19 @@ def compute_polymarket_stats(
     # ----- Proxy weekly stats (fallback) -----
     # If no trades yet, approximate 7d notional as 24h volume * 7
     if gamma_df is not None and not gamma_df.empty:
-        if "volume24hrClob" in gamma_df.columns:
-            v24 = gamma_df["volume24hrClob"].fillna(0).astype(float)
-            weekly_notional = float(v24.sum() * 7)
-        elif "volume24hr" in gamma_df.columns:
-            v24 = gamma_df["volume24hr"].fillna(0).astype(float)
-            weekly_notional = float(v24.sum() * 7)
-    elif display_df is not None and not display_df.empty and "volume_24h" in display_df.columns:
-        # display_df repeats volume per outcome row; avoid double counting by grouping events
-        if "event_ticker" in display_df.columns:
-            weekly_notional = float(display_df.groupby("event_ticker")["volume_24h"].max().sum() * 7)
+        gamma_cols = frozenset(gamma_df.columns)
+        vol_cols = [c for c in ("volume24hrClob", "volume24hr") if c in gamma_cols]
+        if vol_cols:
+            # per market: volume24hrClob when present, else volume24hr
+            v24 = gamma_df[vol_cols].bfill(axis=1).iloc[:, 0]
+            weekly_notional = float(v24.to_numpy(dtype=np.float64, na_value=0.0).sum() * 7)
+    elif display_df is not None and not display_df.empty and "volume_24h" in display_cols:
+        # display_df repeats the market's volume on every outcome row; count each event once
+        if "event_ticker" in display_cols:
+            v24 = display_df.drop_duplicates("event_ticker")["volume_24h"]
+            weekly_notional = float(v24.to_numpy(dtype=np.float64, na_value=0.0).sum() * 7)
         else:
-            weekly_notional = float(display_df["volume_24h"].fillna(0).astype(float).sum() * 7)
+            weekly_notional = float(display_df["volume_24h"].to_numpy(dtype=np.float64, na_value=0.0).sum() * 7)
 
     return ExchangeStats(
         name="Polymarket",
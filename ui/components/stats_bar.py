@@ -1,121 +1,106 @@
 # ui/components/stats_bar.py
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
 from oddsy_services.stats_service import TopLevelStats, ExchangeStats
 
 
+# Static card styles. Re-sent with the bar on every run: Streamlit drops any
+# element a rerun doesn't emit again, so sending this only once would unstyle
+# the cards from the second run on.
+_ODDSY_CSS = (
+    "<style>"
+    ".oddsy-row { display: grid; grid-template-columns: repeat(4, minmax(0, 1fr)); gap: 1rem; }"
+    ".oddsy-card { min-width: 0; padding: 1rem; border-radius: 0.75rem; border: 1px solid #333333; }"
+    ".oddsy-lbl { font-weight: 600; margin-bottom: 0.4rem; }"
+    ".oddsy-sides { display: flex; gap: 1rem; }"
+    ".oddsy-side { flex: 1; }"
+    ".oddsy-sub { font-size: 0.8rem; opacity: 0.6; }"
+    ".oddsy-val { font-size: 1.5rem; font-weight: 600; }"
+    "</style>"
+)
+
+# One overview card; {sides} takes that card's value block(s)
+_CARD_TEMPLATE = "<div class='oddsy-card'><div class='oddsy-lbl'>{label}</div>{sides}</div>"
+
+_SIDE_TEMPLATE = "<div class='oddsy-side'><div class='oddsy-sub'>{name}</div><div class='oddsy-val'>{value}</div></div>"
+
+
+# Bound once so each format call skips the str.format attribute lookup
+_fmt_dollar = "${:,.0f}".format
+_fmt_int = "{:,}".format
+
+
+@lru_cache(maxsize=2048)
 def format_dollar(value: float) -> str:
     # Simple formatting, tweak later to use humanize/abbreviations if you want
-    return f"${value:,.0f}"
+    return _fmt_dollar(value)
 
 
+@lru_cache(maxsize=2048)
 def format_int(value: int) -> str:
-    return f"{value:,}"
+    return _fmt_int(value)
+
 
+# (card label, ExchangeStats field, formatter), in display order
+_METRIC_SPECS = (
+    ("Recent Notional Volume", "weekly_notional_volume", format_dollar),
+    ("Active Markets", "active_markets", format_int),
+    ("Recent Transactions", "weekly_transactions", format_int),
+    ("Open Interest", "open_interest", format_dollar),
+)
 
-def _metric_row(
-    label: str,
-    kalshi_value: Optional[str] = None,
-    polymarket_value: Optional[str] = None,
-    mode: str = "Both",  # "Kalshi" | "Polymarket" | "Both"
-):
-    st.markdown(f"**{label}**")
 
-    if mode == "Kalshi":
-        st.caption("Kalshi")
-        st.markdown(f"### {kalshi_value or '—'}")
-        return
+def _stats_signature(stats: TopLevelStats) -> tuple:
+    # (kalshi, polymarket-or-None) tuples of every value the overview shows, in _METRIC_SPECS order
+    kalshi = stats.kalshi
+    polymarket = stats.polymarket
+    return (
+        tuple(getattr(kalshi, attr) for _, attr, _ in _METRIC_SPECS),
+        polymarket and tuple(getattr(polymarket, attr) for _, attr, _ in _METRIC_SPECS),
+    )
 
-    if mode == "Polymarket":
-        st.caption("Polymarket")
-        st.markdown(f"### {polymarket_value or '—'}")
-        return
 
-    # Both
-    cols = st.columns(2)
-    with cols[0]:
-        st.caption("Kalshi")
-        st.markdown(f"### {kalshi_value or '—'}")
-    with cols[1]:
-        st.caption("Polymarket")
-        st.markdown(f"### {polymarket_value or '—'}")
+# cache_resource hands back the cached str itself; cache_data would unpickle a copy on every hit
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _build_overview_html(kalshi_vals: tuple, poly_vals: Optional[tuple], mode: str) -> str:
+    # Keyed on small tuples of primitives (see _stats_signature), so hashing stays cheap
+    # Only the exchanges this mode shows get formatted ("Kalshi" | "Polymarket" | "Both")
+    columns = []
+    if mode != "Polymarket":
+        kalshi_text = tuple(fmt(v) for (_, _, fmt), v in zip(_METRIC_SPECS, kalshi_vals))
+        columns.append(("Kalshi", kalshi_text))
+    if mode != "Kalshi":
+        if poly_vals:
+            poly_text = tuple(fmt(v) for (_, _, fmt), v in zip(_METRIC_SPECS, poly_vals))
+        else:
+            poly_text = ("—",) * len(_METRIC_SPECS)
+        columns.append(("Polymarket", poly_text))
+
+    # Template methods bound to locals for the loop
+    card_format = _CARD_TEMPLATE.format
+    side_format = _SIDE_TEMPLATE.format
+
+    parts = [_ODDSY_CSS, "<div class='oddsy-row'>"]
+    if len(columns) == 1:
+        # One exchange: its value block sits straight in the card, no side-by-side wrapper
+        (name, text), = columns
+        for i, (label, _, _) in enumerate(_METRIC_SPECS):
+            parts.append(card_format(label=label, sides=side_format(name=name, value=text[i])))
+    else:
+        for i, (label, _, _) in enumerate(_METRIC_SPECS):
+            sides = "".join([side_format(name=name, value=text[i]) for name, text in columns])
+            parts.append(card_format(label=label, sides=f"<div class='oddsy-sides'>{sides}</div>"))
+    parts.append("</div>")
+    return "".join(parts)
 
 
 def render_stats_bar(stats: TopLevelStats, mode: str = "Both"):
-    # Decide if we should show a Polymarket column at all
+    # Unchanged stats (most reruns) hit the cache instead of re-formatting
+    kalshi_vals, poly_vals = _stats_signature(stats)
+    html = _build_overview_html(kalshi_vals, poly_vals, mode)
 
-    kalshi = stats.kalshi
-    polymarket = stats.polymarket
-
-    # Prepare values
-    weekly_notional_k = format_dollar(kalshi.weekly_notional_volume)
-    active_markets_k = format_int(kalshi.active_markets)
-    weekly_tx_k      = format_int(kalshi.weekly_transactions)
-    open_interest_k  = format_dollar(kalshi.open_interest)
-
-    weekly_notional_p = format_dollar(polymarket.weekly_notional_volume) if polymarket else None
-    active_markets_p  = format_int(polymarket.active_markets) if polymarket else None
-    weekly_tx_p       = format_int(polymarket.weekly_transactions) if polymarket else None
-    open_interest_p   = format_dollar(polymarket.open_interest) if polymarket else None
-
-    # Top-level container styling
-    st.markdown("### Overview")
-    st.markdown(
-        """
-        <style>
-        .oddsy-card {
-            padding: 1rem;
-            border-radius: 0.75rem;
-            border: 1px solid #333333;
-            background-color: #0e1117;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.subheader("Overview")
 
-    c1, c2, c3, c4 = st.columns(4)
-
-    with c1:
-        with st.container():
-            st.markdown('<div class="oddsy-card">', unsafe_allow_html=True)
-            _metric_row(
-                label="Recent Notional Volume",
-                kalshi_value=weekly_notional_k,
-                polymarket_value=weekly_notional_p,
-                mode=mode,
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
-
-    with c2:
-        with st.container():
-            st.markdown('<div class="oddsy-card">', unsafe_allow_html=True)
-            _metric_row(
-                label="Active Markets",
-                kalshi_value=active_markets_k,
-                polymarket_value=active_markets_p,
-                mode=mode,
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
-
-    with c3:
-        with st.container():
-            st.markdown('<div class="oddsy-card">', unsafe_allow_html=True)
-            _metric_row(
-                label="Recent Transactions",
-                kalshi_value=weekly_tx_k,
-                polymarket_value=weekly_tx_p,
-                mode=mode,
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
-
-    with c4:
-        with st.container():
-            st.markdown('<div class="oddsy-card">', unsafe_allow_html=True)
-            _metric_row(
-                label="Open Interest",
-                kalshi_value=open_interest_k,
-                polymarket_value=open_interest_p,
-                mode=mode,
-            )
-            st.markdown('</div>', unsafe_allow_html=True)
+    # The whole bar ships as one html element; st.html skips markdown parsing entirely
+    st.html(html)